@@ -4,7 +4,7 @@ import argparse
 import logging
 from typing import Optional, Sequence
 
-from .constants import YEAR_MENU_URL
+from .constants import DEFAULT_WORKERS, YEAR_MENU_URL
 from .scraper import Scraper
 
 
@@ -21,11 +21,31 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Do not prompt for a limit if --limit is not provided.",
     )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Parse pages on this many worker processes while fetching continues (default: 0, parse inline).",
+    )
+    parser.add_argument(
+        "--selenium",
+        action="store_true",
+        help="Fetch pages with Selenium Chrome instead of plain HTTP (only needed for JS-rendered pages).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=(
+            "Number of yearly pages fetched concurrently; also the Chrome pool size with --selenium "
+            f"(default: {DEFAULT_WORKERS})."
+        ),
+    )
     parser.add_argument(
         "--headless",
         action=argparse.BooleanOptionalAction,
         default=True,
-        help="Run Chrome headless (default: true).",
+        help="Run Chrome headless in --selenium mode (default: true).",
     )
     parser.add_argument(
         "--profile-dir",
@@ -37,6 +57,14 @@ def build_parser() -> argparse.ArgumentParser:
         default=".",
         help="Directory to write CSV outputs (default: current directory).",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help=(
+            "Cache fetched pages in this directory for up to 30 days, so re-runs skip the network "
+            "(development aid; cached pages can be stale). Off by default."
+        ),
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -104,7 +132,14 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     limit = parse_limit_with_optional_prompt(limit=args.limit, prompt=not args.no_prompt)
     league = parse_league_with_optional_prompt(league=args.league, prompt=not args.no_prompt)
 
-    scraper = Scraper(headless=args.headless, profile_dir=args.profile_dir)
+    scraper = Scraper(
+        headless=args.headless,
+        profile_dir=args.profile_dir,
+        use_selenium=args.selenium,
+        workers=args.workers,
+        cache_dir=args.cache_dir,
+        parse_workers=args.parse_workers,
+    )
     scraper.scrape(menu_url=YEAR_MENU_URL, limit_years=limit, out_dir=args.out_dir, league=league)
     return 0
 
@@ -2,12 +2,58 @@ import re
 
 YEAR_MENU_URL = "https://www.baseball-almanac.com/yearmenu.shtml"
 
-# Matches the year-menu link format like ".../yearly/yr1970n.shtml" or ".../yearly/yr1934a.shtml".
-YEARLY_LINK_RE = re.compile(r"/yearly/yr(?P<year>\d{4})(?P<league_code>[an])\.shtml$")
+# Year-menu link format like ".../yearly/yr1970n.shtml" or ".../yearly/yr1934a.shtml":
+# YEARLY_LINK_PREFIX, a 4-digit year, a league code ("a"/"n"), then YEARLY_LINK_EXTENSION.
+YEARLY_LINK_PREFIX = "/yearly/yr"
+YEARLY_LINK_EXTENSION = ".shtml"
+YEARLY_LINK_SUFFIXES = tuple(f"{code}{YEARLY_LINK_EXTENSION}" for code in ("a", "n"))
+
+# League code in yearly links -> league name as reported in the output tables.
+LEAGUE_NAMES = {"a": "American League", "n": "National League"}
 
 # Matches the H1 header content on year pages.
 YEAR_LEAGUE_HEADER_RE = re.compile(r"(?P<year>\d{4})\s(?P<league>AMERICAN|NATIONAL)\sLEAGUE")
 
+# Classify stat tables from their header text: player/pitcher tables vs. team tables.
+# `TABLE_HEADER_RE.search(...).lastgroup` is "player" or "team".
+TEAM_TABLE_RE = re.compile(r"Team(?= Review)|Team Standings")
+TABLE_HEADER_RE = re.compile(rf"(?P<player>Player|Pitcher)|(?P<team>{TEAM_TABLE_RE.pattern})")
+
 # Extracts canonical stat table keys from header text.
 STAT_TABLE_KEY_RE = re.compile(r"\b(Hitting Statistics|Pitching Statistics|Standings)\b")
 
+
+# Standings banner cells naming a division; these columns are reported as "Region".
+STANDINGS_REGIONS = frozenset(("East", "Central", "West"))
+
+# Suffix on linked team-name banner cells, stripped from column names.
+ROSTER_LINK_SUFFIX = " [Click for roster]"
+
+# Standings header variants -> canonical column name.
+STANDINGS_COLUMN_ALIASES = {
+    f"Team{ROSTER_LINK_SUFFIX}": "Team",
+    "Team | Roster": "Team",
+    "Wins": "W",
+    "Losses": "L",
+}
+
+# Plain-HTTP fetching defaults (the almanac pages are static HTML).
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+REQUEST_TIMEOUT_SECONDS = 10
+
+# Selenium mode: how long to wait for a page's tables to appear after navigation.
+SELENIUM_WAIT_SECONDS = 10
+# Selenium mode: environment variable naming a chromedriver to use instead of resolving one with webdriver_manager.
+CHROMEDRIVER_PATH_ENV = "CHROMEDRIVER_PATH"
+
+# Selenium mode: cap on `driver.get` itself, so a hanging third-party subresource can't stall a worker.
+SELENIUM_PAGE_LOAD_TIMEOUT_SECONDS = 15
+
+# Concurrency for yearly page fetches. Every page comes from the same host, so this is also the number
+# of requests in flight against it. Each request first waits a random 0..POLITE_DELAY_STEPS * 100ms
+# so bursts don't look like a flood.
+DEFAULT_WORKERS = 6
+POLITE_DELAY_STEPS = 5
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+
+class PageCache:
+    """
+    On-disk cache of fetched pages, keyed by a hash of the URL.
+
+    Pages are stored gzip-compressed, one file per URL. Raw HTTP bodies (`bytes`) and rendered
+    Selenium page sources (`str`) are stored under different suffixes so each comes back as the
+    type it was stored as (raw bytes keep their `<meta charset>` for lxml to honor).
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], *, max_age_days: float = 30):
+        """
+        - **cache_dir**: Directory holding the cached pages (created if missing).
+        - **max_age_days**: Entries older than this are treated as missing and re-fetched.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_age_seconds = max_age_days * 24 * 60 * 60
+
+    def _path(self, url: str, *, text: bool) -> Path:
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.{'txt' if text else 'html'}.gz"
+
+    def get(self, url: str) -> Optional[Union[bytes, str]]:
+        """Return the cached page for `url`, or `None` when it is missing or expired."""
+        now = time.time()
+        for text in (False, True):
+            path = self._path(url, text=text)
+            try:
+                if now - path.stat().st_mtime > self.max_age_seconds:
+                    continue
+                content = gzip.decompress(path.read_bytes())
+            except (OSError, EOFError):
+                continue
+            return content.decode("utf-8") if text else content
+        return None
+
+    def put(self, url: str, content: Union[bytes, str]) -> None:
+        """Store `content` for `url` (written atomically, so concurrent readers never see partial files)."""
+        text = isinstance(content, str)
+        path = self._path(url, text=text)
+        data = gzip.compress(content.encode("utf-8") if text else content)
+
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{time.monotonic_ns()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
@@ -0,0 +1,378 @@
+from __future__ import annotations
+
+import logging
+import re
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from lxml import etree
+
+from .constants import (
+    ROSTER_LINK_SUFFIX,
+    STANDINGS_REGIONS,
+    STAT_TABLE_KEY_RE,
+    TABLE_HEADER_RE,
+    TEAM_TABLE_RE,
+    YEAR_LEAGUE_HEADER_RE,
+)
+
+# Tags that start a new line in rendered text (mirrors what Selenium's `.text` reports).
+_BLOCK_TAGS = frozenset(("div", "h1", "h2", "h3", "h4", "h5", "h6", "li", "p", "table", "tr"))
+# Tags whose contents are never rendered as text.
+_HIDDEN_TAGS = frozenset(("script", "style", "noscript"))
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Selectors are compiled once at import instead of on every row.
+_ROWS_XPATH = etree.XPath(".//tr")
+_HEADER_XPATH = etree.XPath(".//h2 | .//p")
+_BANNER_XPATH = etree.XPath(".//td[contains(@class, 'banner')]")
+_DATA_CELL_XPATH = etree.XPath(".//td[contains(@class, 'datacolBox') or contains(@class, 'datacolBlue')]")
+_HAS_ROWSPAN = etree.XPath("boolean(.//td[@rowspan])")
+_MENTIONS_EVENTS = etree.XPath("contains(., 'Events') or contains(., 'Salary')")
+
+# column name -> values; stat tables are kept column-oriented all the way to the DataFrames
+Columns = Dict[str, List[Any]]
+# stat table name -> columns
+StatTables = Dict[str, Columns]
+# (year, league, player_stats, team_stats, events) for one yearly page
+ParsedPage = Tuple[Optional[int], Optional[str], StatTables, StatTables, Dict[str, List[str]]]
+
+
+def _collect_text(el, parts: List[str]) -> None:
+    tag = el.tag
+    if not isinstance(tag, str) or tag in _HIDDEN_TAGS:
+        # Comments, processing instructions and scripts carry no visible text.
+        return
+
+    append = parts.append
+    collapse = _WHITESPACE_RE.sub
+    is_block = tag in _BLOCK_TAGS
+
+    if is_block or tag == "br":
+        append("\n")
+    if el.text:
+        append(collapse(" ", el.text))
+    for child in el:
+        _collect_text(child, parts)
+        tail = child.tail
+        if tail:
+            append(collapse(" ", tail))
+    if is_block:
+        append("\n")
+
+
+def _is_intro_header(el) -> bool:
+    """True for the `div.intro > h1` header that names a yearly page's year and league."""
+    parent = el.getparent()
+    return parent is not None and parent.tag == "div" and "intro" in (parent.get("class") or "").split()
+
+
+def _element_text(el) -> str:
+    """
+    Return the visible text of an lxml element, similar to Selenium's `WebElement.text`.
+
+    Whitespace runs are collapsed, `<br>` and block-level tags become line breaks,
+    and blank lines are dropped.
+    """
+    parts: List[str] = []
+    _collect_text(el, parts)
+    lines = (line.strip() for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+class PageParser:
+    """
+    Parses Baseball Almanac yearly pages (player/team stat tables, header, "events" blurb) with lxml.
+
+    Parsing is pure Python on an in-memory document, so it can run on any thread or in a worker
+    process (see `parse_page`).
+    """
+
+    def __init__(self, *, logger: Optional[logging.Logger] = None):
+        """
+        - **logger**: Optional logger for debug output.
+        """
+        self.logger = logger or logging.getLogger(__name__)
+
+    # ---------- Page parsing ----------
+    def parse(
+        self,
+        raw_html: Union[bytes, str],
+        *,
+        year: Optional[int] = None,
+        league: Optional[str] = None,
+    ) -> ParsedPage:
+        """
+        Parse a yearly page into `(year, league, player_stats, team_stats, events)`.
+
+        When the caller already knows `year` and `league` (e.g. from the page URL) the page header isn't parsed.
+        Otherwise they come from the header, and are `None` (with empty stats) when it doesn't match expectations.
+
+        The page is streamed with `iterparse` in a single pass: each boxed table is parsed as soon as its
+        closing tag is read and then cleared, so finished tables don't pile up in memory, and the "events"
+        cell is located along the way instead of by a second scan of the document.
+        """
+        is_text = isinstance(raw_html, str)
+        context = etree.iterparse(
+            BytesIO(raw_html.encode("utf-8") if is_text else raw_html),
+            events=("end",),
+            tag=("h1", "table", "td"),
+            html=True,
+            # Rendered Selenium sources are re-encoded as UTF-8, whatever their <meta charset> says.
+            encoding="utf-8" if is_text else None,
+            collect_ids=False,
+            remove_comments=True,
+            remove_pis=True,
+        )
+
+        need_header = not (year and league)
+        header: Optional[str] = None
+        player: StatTables = {}
+        team: StatTables = {}
+        # The first <td> (in document order) mentioning events, and its <td> ancestors.
+        events_cell = None
+        events_cell_ancestors: Set[Any] = set()
+
+        for _, elem in context:
+            tag = elem.tag
+            if tag == "td":
+                # End events arrive innermost-first, so an enclosing cell that closes later still
+                # precedes the current match in document order and takes over.
+                if events_cell is None:
+                    if _MENTIONS_EVENTS(elem):
+                        events_cell = elem
+                        events_cell_ancestors = set(elem.iterancestors("td"))
+                elif elem in events_cell_ancestors:
+                    events_cell = elem
+                continue
+
+            if tag == "h1":
+                if need_header and header is None and _is_intro_header(elem):
+                    header = _element_text(elem)
+                continue
+
+            if "boxed" not in (elem.get("class") or "").split():
+                continue
+
+            self.add_table(elem, player, team)
+            # Keep tables mentioning events: the events cell's text is read once the page is done.
+            if not _MENTIONS_EVENTS(elem):
+                elem.clear(keep_tail=True)
+
+        if need_header:
+            year, league = self.year_league_from_header(header or "")
+        if not year or not league:
+            return None, None, {}, {}, {}
+
+        events = self.events_from_cell(events_cell) if events_cell is not None else {}
+        return year, league, player, team, events
+
+    def year_league_from_header(self, header: str) -> Tuple[Optional[int], Optional[str]]:
+        """Match a yearly page's `div.intro > h1` text to `(year, league)`, or `(None, None)`."""
+        m = YEAR_LEAGUE_HEADER_RE.search(header)
+        if not m:
+            return None, None
+
+        year = int(m.group("year"))
+        league = m.group("league").title() + " League"
+
+        if league == "American League" and year < 1901:
+            return None, None
+
+        return year, league
+
+    def add_table(self, table, player_stats_dict: StatTables, team_stats_dict: StatTables) -> None:
+        """
+        Parse one boxed table and store it in `player_stats_dict` or `team_stats_dict` under its stat name.
+
+        Tables without a recognizable name, column banner or data rows are ignored.
+        """
+        col_names: List[str] = []
+        duplicate_rows: Dict[int, List[Any]] = {}
+        table_name: Optional[List[str]] = None
+        col_num: Optional[int] = None
+        data_list: List[List[str]] = []
+        # Most tables have no rowspans at all; skip the per-cell rowspan bookkeeping for those.
+        has_rowspan = _HAS_ROWSPAN(table)
+
+        # Bound once: this loop runs for every row of every table on the page.
+        find_table_name_and_columns = self.find_table_name_and_columns
+        find_col_names = self.find_col_names
+        find_cell_data = self.find_cell_data
+        add_row = data_list.append
+
+        for row in _ROWS_XPATH(table):
+            temp_table_name, temp_col_num = find_table_name_and_columns(row)
+            temp_col_names, temp_dup_from_header = find_col_names(row)
+            row_data, temp_dup_from_cells = find_cell_data(
+                row,
+                col_num,
+                duplicate_rows,
+                track_rowspans=has_rowspan,
+            )
+
+            if temp_table_name:
+                table_name = temp_table_name
+            if temp_col_num:
+                col_num = temp_col_num
+            if temp_dup_from_header:
+                duplicate_rows = temp_dup_from_header
+            if temp_col_names:
+                col_names = temp_col_names
+            if temp_dup_from_cells is not None:
+                duplicate_rows = temp_dup_from_cells
+
+            if row_data and col_names and len(row_data) == len(col_names):
+                add_row(row_data)
+
+        if not (table_name and col_names and data_list):
+            # Banner-only/header-only tables (e.g. "Team Review" section titles) carry no data.
+            return
+
+        # Transpose rows into columns (a repeated column name keeps its last values, like dict(zip())).
+        columns = {name: list(values) for name, values in zip(col_names, zip(*data_list))}
+        if table_name[0] == "Player":
+            player_stats_dict[table_name[-1]] = columns
+        elif table_name[0] == "Team":
+            team_stats_dict[table_name[-1]] = columns
+
+        self.logger.debug(
+            "Captured table %s (%d rows, %d cols)",
+            " / ".join(table_name),
+            len(data_list),
+            len(col_names),
+        )
+
+    def find_table_name_and_columns(self, row) -> Tuple[Optional[List[str]], Optional[int]]:
+        """
+        Detect the table category/name from header rows and extract expected column count.
+
+        Returns:
+        - `(table_name_parts, num_cols)` where `table_name_parts` looks like
+          `["Player", "Hitting Statistics"]` or `["Team", "Standings"]`
+        - `(None, None)` when the row isn't a header row
+        """
+        headers = [_element_text(h) for h in _HEADER_XPATH(row)]
+        if not headers or not headers[0]:
+            return None, None
+
+        table_name: List[str] = []
+
+        # One scan of the title line classifies Player/Pitcher vs. Team tables. Team tables
+        # can also carry their title in the second header line depending on the page.
+        m = TABLE_HEADER_RE.search(headers[0])
+        if m is None and len(headers) > 1:
+            m = TEAM_TABLE_RE.search(headers[1])
+            kind = "team" if m else None
+        else:
+            kind = m.lastgroup if m else None
+
+        if kind == "player":
+            table_name.append("Player")
+        elif kind == "team":
+            table_name.extend(m.group().split(" "))
+
+        # Stat key is usually in the second header line (but we normalize it).
+        if len(headers) > 1:
+            m_key = STAT_TABLE_KEY_RE.search(headers[1])
+            if m_key:
+                table_name.append(m_key.group(1))
+
+        if not table_name:
+            return None, None
+
+        first_cell = row.find(".//td")
+        num_cols_attr = first_cell.get("colspan") if first_cell is not None else None
+        num_cols = int(num_cols_attr) if num_cols_attr and num_cols_attr.isdigit() else None
+        return table_name, num_cols
+
+    def find_col_names(self, row) -> Tuple[Optional[List[str]], Optional[Dict[int, List[Any]]]]:
+        """
+        Extract column names from a "banner" row and detect header rowspans.
+        """
+        elements = _BANNER_XPATH(row)
+        if not elements:
+            return None, None
+
+        col_names: List[str] = []
+        duplicate_row_val: Dict[int, List[Any]] = {}
+
+        for idx, el in enumerate(elements):
+            text = _element_text(el)
+            num_rows = el.get("rowspan")
+            if num_rows:
+                duplicate_row_val[idx] = [text, int(num_rows)]
+
+            if text in STANDINGS_REGIONS:
+                col_names.append("Region")
+            elif ROSTER_LINK_SUFFIX in text:
+                col_names.append(text.replace(ROSTER_LINK_SUFFIX, "").strip())
+            else:
+                col_names.append(text)
+
+        return col_names, duplicate_row_val
+
+    def find_cell_data(
+        self,
+        row,
+        num_cols: Optional[int],
+        duplicate_rows: Dict[int, List[Any]],
+        *,
+        track_rowspans: bool = True,
+    ) -> Tuple[Optional[List[str]], Dict[int, List[Any]]]:
+        """
+        Extract cell text for a data row, handling rowspans by re-inserting duplicated values.
+
+        Pass `track_rowspans=False` when the table is known to have no `rowspan` cells.
+        """
+        cells = _DATA_CELL_XPATH(row)
+        if not cells:
+            return None, duplicate_rows
+
+        data = [_element_text(cell) for cell in cells]
+        if track_rowspans:
+            for idx, cell in enumerate(cells):
+                num_rows = int(cell.get("rowspan") or 0)
+                if num_rows > 0:
+                    duplicate_rows[idx] = [data[idx], num_rows]
+
+        if duplicate_rows and num_cols is not None and len(data) != num_cols:
+            for idx, value in list(duplicate_rows.items()):
+                data.insert(idx, value[0])
+                value[1] -= 1
+            # Only counters decremented above can have run out.
+            duplicate_rows = {k: v for k, v in duplicate_rows.items() if v[1] > 0}
+
+        return data, duplicate_rows
+
+    def events_from_cell(self, cell) -> Dict[str, List[str]]:
+        """Parse "<title>: a | b | ..." lines whose title mentions Events or Salary out of a cell's text."""
+        events_dict: Dict[str, List[str]] = {}
+        event_text = _element_text(cell).split("\n")
+        for line in event_text:
+            if ": " not in line:
+                continue
+
+            title, rhs = line.split(": ", 1)
+            if "Events" in title or "Salary" in title:
+                events_dict[title] = rhs.split(" | ")
+
+        return events_dict
+
+
+_DEFAULT_PARSER = PageParser()
+
+
+def parse_page(
+    raw_html: Union[bytes, str],
+    *,
+    year: Optional[int] = None,
+    league: Optional[str] = None,
+) -> ParsedPage:
+    """
+    Parse a yearly page with a module-level `PageParser`.
+
+    A plain function (unlike a bound method) pickles cheaply, so this is what gets submitted
+    to a `ProcessPoolExecutor`.
+    """
+    return _DEFAULT_PARSER.parse(raw_html, year=year, league=league)
@@ -1,23 +1,100 @@
 from __future__ import annotations
 
+import csv
 import logging
-import re
+import multiprocessing
+import queue
+import random
 from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
 from time import sleep
-from typing import Any, DefaultDict, Dict, Iterable, List, Optional, Tuple
+from typing import Any, DefaultDict, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple, Union
 
+import lxml.html
 import pandas as pd
-from selenium.webdriver.common.by import By
+from lxml.cssselect import CSSSelector
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # PyArrow is optional; CSVs fall back to `DataFrame.to_csv`.
+    pa = None
 
 from .constants import (
-    STAT_TABLE_KEY_RE,
-    YEAR_LEAGUE_HEADER_RE,
-    YEARLY_LINK_RE,
+    DEFAULT_WORKERS,
+    LEAGUE_NAMES,
+    POLITE_DELAY_STEPS,
+    REQUEST_TIMEOUT_SECONDS,
+    SELENIUM_WAIT_SECONDS,
+    STANDINGS_COLUMN_ALIASES,
+    YEARLY_LINK_EXTENSION,
+    YEARLY_LINK_PREFIX,
+    YEARLY_LINK_SUFFIXES,
 )
-from .webdriver_factory import build_chrome_driver
+from .page_cache import PageCache
+from .page_parser import Columns, PageParser, ParsedPage, parse_page
+from .session_factory import build_session
+
+# (No "> tbody >" in the menu selector: lxml, unlike a browser, doesn't insert implicit <tbody> elements.)
+_YEAR_MENU_LINKS = CSSSelector("table.ba-sub tr > td.datacolBox > a")
+
+
+class YearLink(NamedTuple):
+    """A yearly page link from the year menu, with the year/league encoded in its URL."""
+
+    href: str
+    year: int
+    league: str
+
+
+def _parse_yearly_href(href: str) -> Optional[Tuple[int, str]]:
+    """
+    Return `(year, league_code)` for a ".../yearly/yrYYYYx.shtml" link, or None for any other href.
+
+    Plain string checks instead of a regex: the menu page has a couple hundred anchors to sift through.
+    """
+    if not href.endswith(YEARLY_LINK_SUFFIXES):
+        return None
+
+    # Layout from the end: "<prefix>" + 4-digit year + league code + ".shtml".
+    code_at = len(href) - len(YEARLY_LINK_EXTENSION) - 1
+    year = href[code_at - 4 : code_at]
+    if not (year.isdecimal() and href.endswith(YEARLY_LINK_PREFIX, 0, code_at - 4)):
+        return None
+
+    return int(year), href[code_at]
+
+
+def _to_arrow_tables(frames: List[pd.DataFrame]) -> Optional[List["pa.Table"]]:
+    """
+    Convert every output frame for PyArrow's C++ CSV writer, or return None to write them all with pandas.
+
+    The choice is made once for all frames so that a run never mixes the two writers' CSV dialects.
+    """
+    if pa is None:
+        return None
+    try:
+        return [pa.Table.from_pandas(df, preserve_index=False) for df in frames]
+    except pa.ArrowException:
+        # e.g. an object column mixing types that Arrow can't infer a single type for.
+        return None
+
+
+def _write_csv(df: pd.DataFrame, table: Optional["pa.Table"], path: Path) -> None:
+    """
+    Write one output CSV: from its Arrow `table` when there is one, otherwise from `df` with pandas.
+
+    Both writers quote the header and every string field and leave numbers unquoted. A frame without
+    columns is always written by pandas (as a single empty line), whichever writer the run uses.
+    """
+    if table is not None and table.num_columns:
+        pacsv.write_csv(table, str(path))
+    else:
+        df.to_csv(path, index=False, quoting=csv.QUOTE_NONNUMERIC)
 
 
-class Scraper:
+class Scraper(PageParser):
     """
     Scrapes yearly baseball league stats from Baseball Almanac.
 
@@ -25,6 +102,9 @@ class Scraper:
     - Collect yearly links (AL/NL).
     - For each year page, parse player/team tables and a small "events" blurb.
     - Flatten into Pandas DataFrames and export to CSV.
+
+    Pages are fetched over plain HTTP and parsed in-process with lxml (see `PageParser`). Chrome is only
+    started when `use_selenium=True` (for pages that need JavaScript to render).
     """
 
     def __init__(
@@ -32,32 +112,58 @@ class Scraper:
         *,
         headless: bool = True,
         profile_dir: str = "selenium_profile",
+        use_selenium: bool = False,
+        workers: int = DEFAULT_WORKERS,
+        cache_dir: Optional[str] = None,
+        parse_workers: int = 0,
         logger: Optional[logging.Logger] = None,
     ):
         """
-        Initialize the scraper state and create a Selenium Chrome driver.
-
-        - **headless**: Run Chrome without a visible UI.
-        - **profile_dir**: Directory where Chrome user-data is stored (cache/cookies).
+        Initialize the scraper state and the page fetcher.
+
+        - **headless**: Run Chrome without a visible UI (Selenium mode only).
+        - **profile_dir**: Directory where Chrome user-data is stored (Selenium mode only).
+        - **use_selenium**: Fetch pages through a Selenium Chrome driver instead of HTTP.
+        - **workers**: Number of yearly pages fetched concurrently (also the Chrome pool size in Selenium mode).
+        - **cache_dir**: Directory for the on-disk page cache; `None` disables caching.
+        - **parse_workers**: Number of processes parsing pages; 0 parses on the calling thread.
         - **logger**: Optional logger for progress reporting.
         """
-        self.logger = logger or logging.getLogger(__name__)
+        super().__init__(logger=logger or logging.getLogger(__name__))
 
         self.events: Dict[int, Dict[str, List[str]]] = {}
-        self.player_stats: DefaultDict[int, Dict[str, Dict[str, List[Dict[str, str]]]]] = defaultdict(dict)
-        self.team_stats: DefaultDict[int, Dict[str, Dict[str, List[Dict[str, str]]]]] = defaultdict(dict)
+        # Output tables (stat table name -> columns), filled page by page with Year/League already tagged.
+        self.player_tables: DefaultDict[str, Columns] = defaultdict(dict)
+        self.team_tables: DefaultDict[str, Columns] = defaultdict(dict)
+        self._stored_pages: Set[Tuple[int, str]] = set()
+
+        self.workers = max(1, workers)
+        self.parse_workers = max(0, parse_workers)
+
+        self.headless = headless
+        self.profile_dir = profile_dir
+        self.use_selenium = use_selenium
+        if use_selenium:
+            self.logger.info(
+                "Using pooled Chrome drivers (headless=%s, profile_dir=%s, pool_size=%d)",
+                headless,
+                profile_dir,
+                self.workers,
+            )
 
-        self.logger.info("Initializing Chrome driver (headless=%s, profile_dir=%s)", headless, profile_dir)
-        self.driver = build_chrome_driver(headless=headless, profile_dir=profile_dir)
-        self.logger.info("Chrome driver ready")
+        self.session = build_session(pool_size=self.workers)
+        self.cache = PageCache(cache_dir) if cache_dir else None
+        if self.cache is not None:
+            self.logger.info("Using page cache: %s", cache_dir)
 
     def close(self) -> None:
-        """Close the Selenium driver (safe to call multiple times)."""
-        try:
-            self.logger.info("Closing Chrome driver")
-            self.driver.quit()
-        except Exception:
-            pass
+        """
+        Close the HTTP session (safe to call multiple times).
+
+        Pooled Chrome drivers are handed back after every page load and stay warm for reuse;
+        they are quit at interpreter exit.
+        """
+        self.session.close()
 
     # ---------- Orchestration ----------
     def scrape(
@@ -92,8 +198,8 @@ class Scraper:
             self.close()
 
         self.logger.info("Converting scraped stats to DataFrames")
-        player_hit_df, player_pitch_df, _player_standing_df = self.convert_stats_to_df(self.player_stats)
-        team_hit_df, team_pitch_df, standing_df = self.convert_stats_to_df(self.team_stats)
+        player_hit_df, player_pitch_df, _player_standing_df = self.tables_to_dfs(self.player_tables)
+        team_hit_df, team_pitch_df, standing_df = self.tables_to_dfs(self.team_tables)
 
         outputs = [
             ("player_hit.csv", player_hit_df),
@@ -103,17 +209,73 @@ class Scraper:
             ("standing.csv", standing_df),
         ]
 
-        for filename, df in outputs:
-            path = f"{out_dir.rstrip('/')}/{filename}"
+        out_path = Path(out_dir)
+        tables = _to_arrow_tables([df for _, df in outputs])
+        if tables is None:
+            self.logger.info("Writing CSVs with pandas")
+
+        def write_output(idx: int) -> None:
+            filename, df = outputs[idx]
+            path = out_path / filename
             self.logger.info("Writing %s (%d rows, %d cols)", path, len(df.index), len(df.columns))
-            df.to_csv(path, index=False)
+            _write_csv(df, tables[idx] if tables is not None else None, path)
+
+        # The writers spend most of their time in C++/disk I/O outside the GIL, so the files overlap.
+        with ThreadPoolExecutor(max_workers=len(outputs)) as pool:
+            list(pool.map(write_output, range(len(outputs))))
 
         self.logger.info("Scrape finished successfully")
 
     # ---------- Navigation ----------
-    def get_year_links(self, menu_url: str, *, league: str = "BOTH") -> List[str]:
+    def fetch(self, url: str, *, ready_selector: str = "table.boxed") -> Union[bytes, str]:
+        """
+        Fetch `url` and return the raw page HTML, serving it from the page cache when possible.
+
+        Uses the HTTP session by default, or the Chrome driver's rendered page source in Selenium mode
+        (after waiting for `ready_selector` to appear). Safe to call from worker threads; every request is
+        slightly jittered, and `log_data` bounds how many run at once (`workers`).
+        """
+        if self.cache is not None:
+            cached = self.cache.get(url)
+            if cached is not None:
+                self.logger.debug("Cache hit: %s", url)
+                return cached
+
+        raw_html = self._download(url, ready_selector=ready_selector)
+        if self.cache is not None:
+            self.cache.put(url, raw_html)
+        return raw_html
+
+    def _download(self, url: str, *, ready_selector: str) -> Union[bytes, str]:
+        """Load `url` over the network (HTTP session or pooled Chrome driver)."""
+        sleep(random.randint(0, POLITE_DELAY_STEPS) * 0.1)
+
+        if self.use_selenium:
+            # Imported here so plain-HTTP runs don't load (or even need) selenium/webdriver_manager.
+            from .webdriver_factory import acquire_driver, load_page, wait_for_selector
+
+            with acquire_driver(
+                headless=self.headless,
+                profile_dir=self.profile_dir,
+                max_drivers=self.workers,
+            ) as driver:
+                load_page(driver, url)
+                if not wait_for_selector(driver, ready_selector, timeout=SELENIUM_WAIT_SECONDS):
+                    self.logger.warning("Timed out waiting for %r on %s", ready_selector, url)
+                    raise TimeoutError(f"{ready_selector!r} not found on {url}")
+                return driver.page_source
+
+        resp = self.session.get(url, timeout=REQUEST_TIMEOUT_SECONDS)
+        resp.raise_for_status()
+        return resp.content
+
+    def fetch_tree(self, url: str, *, ready_selector: str = "table.boxed") -> lxml.html.HtmlElement:
+        """Fetch `url` and return the parsed lxml document."""
+        return lxml.html.fromstring(self.fetch(url, ready_selector=ready_selector))
+
+    def get_year_links(self, menu_url: str, *, league: str = "BOTH") -> List[YearLink]:
         """
-        Load the year-menu page and return yearly AL/NL links.
+        Load the year-menu page and return yearly AL/NL links, with the year/league their URL encodes.
 
         Filter:
         - keep all National League years
@@ -125,12 +287,10 @@ class Scraper:
         - 'BOTH': both leagues
         """
         self.logger.info("Loading year menu: %s", menu_url)
-        self.driver.get(menu_url)
+        tree = self.fetch_tree(menu_url, ready_selector="table.ba-sub")
+        tree.make_links_absolute(menu_url)
 
-        anchors = self.driver.find_elements(
-            By.CSS_SELECTOR,
-            "table.ba-sub > tbody > tr > td.datacolBox > a",
-        )
+        anchors = _YEAR_MENU_LINKS(tree)
 
         want: Optional[str] = None
         if league == "AL":
@@ -138,15 +298,14 @@ class Scraper:
         elif league == "NL":
             want = "n"
 
-        links: List[str] = []
+        links: List[YearLink] = []
         for a in anchors:
-            href = a.get_attribute("href") or ""
-            m = YEARLY_LINK_RE.search(href)
-            if not m:
+            href = a.get("href") or ""
+            parsed = _parse_yearly_href(href)
+            if parsed is None:
                 continue
 
-            year = int(m.group("year"))
-            league_code = m.group("league_code")
+            year, league_code = parsed
 
             if want is not None and league_code != want:
                 continue
@@ -154,330 +313,160 @@ class Scraper:
             if league_code == "a" and year < 1901:
                 continue
 
-            links.append(href)
+            links.append(YearLink(href, year, LEAGUE_NAMES[league_code]))
 
         self.logger.info("Found %d yearly links (post-filter)", len(links))
         return links
 
-    def log_data(self, links: Iterable[str]) -> None:
+    def log_data(self, links: Iterable[YearLink]) -> None:
         """
         Visit each yearly link and extract player/team/event data into in-memory dictionaries.
+
+        Fetcher threads push raw pages onto a queue as they arrive; the calling thread drains it and parses
+        each page (inline, or on `parse_workers` processes) while the remaining fetches are still in flight.
+        Results are stored in link order, so the output row order does not depend on network timing.
+
+        Year and league come from each link's URL, so the page header is only parsed as a fallback.
         """
         links_list = list(links)
         total = len(links_list)
-        self.logger.info("Scraping %d yearly pages", total)
+        self.logger.info(
+            "Scraping %d yearly pages (fetch workers=%d, parse workers=%d)",
+            total,
+            self.workers,
+            self.parse_workers,
+        )
 
-        for idx, link in enumerate(links_list, start=1):
+        pages: "queue.Queue[Tuple[int, Optional[Union[bytes, str]]]]" = queue.Queue()
+
+        def fetch_into_queue(idx: int, link: YearLink) -> None:
+            raw_html = None
             try:
-                self.logger.info("(%d/%d) Loading: %s", idx, total, link)
-                self.driver.get(link)
-                sleep(2)
+                raw_html = self.fetch(link.href)
+                self.logger.info("(%d/%d) Loaded: %s", idx, total, link.href)
             except Exception:
-                self.logger.warning("(%d/%d) Failed to load: %s", idx, total, link)
-                continue
-
-            year, league = self.get_year_league()
-            if not year or not league:
-                self.logger.warning("(%d/%d) Skipping page (could not parse year/league): %s", idx, total, link)
-                continue
-
-            self.logger.info("(%d/%d) Parsed: year=%s league=%s", idx, total, year, league)
-            player, team = self.get_data()
-            self.player_stats[year][league] = player
-            self.team_stats[year][league] = team
-
-            self.logger.info(
-                "(%d/%d) Extracted tables: player=%d team=%d",
-                idx,
-                total,
-                len(player.keys()),
-                len(team.keys()),
+                self.logger.warning("(%d/%d) Failed to load: %s", idx, total, link.href)
+            finally:
+                # Always report back, so the consumer below never waits on a page that won't come.
+                pages.put((idx, raw_html))
+
+        parse_pool = None
+        if self.parse_workers:
+            # "spawn" rather than fork: the fetcher threads are already running when workers start.
+            parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context("spawn"),
             )
 
-            if year not in self.events:
-                self.events[year] = self.clean_events()
-                self.logger.info("(%d/%d) Extracted events keys: %s", idx, total, list(self.events[year].keys()))
-
-    def get_year_league(self) -> Tuple[Optional[int], Optional[str]]:
-        """
-        Parse the current yearly page header to determine (year, league).
-
-        Returns `(None, None)` when the header doesn't match expectations.
-        """
+        parsed: Dict[int, Union[ParsedPage, "Future[ParsedPage]"]] = {}
         try:
-            header = self.driver.find_element(By.CSS_SELECTOR, "div.intro > h1").text
-        except Exception:
-            return None, None
-
-        m = YEAR_LEAGUE_HEADER_RE.search(header or "")
-        if not m:
-            return None, None
-
-        year = int(m.group("year"))
-        league = m.group("league").title() + " League"
-
-        if league == "American League" and year < 1901:
-            return None, None
-
-        return year, league
-
-    # ---------- Page parsing ----------
-    def get_data(self) -> Tuple[Dict[str, List[Dict[str, str]]], Dict[str, List[Dict[str, str]]]]:
-        """
-        Parse all boxed tables on the current yearly page.
-
-        Returns:
-        - `player_stats_dict`: maps stat table name -> list of row dicts
-        - `team_stats_dict`: maps stat table name -> list of row dicts
-        """
-        player_stats_dict: Dict[str, List[Dict[str, str]]] = {}
-        team_stats_dict: Dict[str, List[Dict[str, str]]] = {}
-
-        boxed_tables = self.driver.find_elements(By.CSS_SELECTOR, "table.boxed")
-        self.logger.debug("Found %d boxed tables on page", len(boxed_tables))
-
-        for table in boxed_tables:
-            col_names: List[str] = []
-            duplicate_rows: Dict[int, List[Any]] = {}
-            table_name: Optional[List[str]] = None
-            col_num: Optional[int] = None
-            data_list: List[List[str]] = []
-
-            rows = table.find_elements(By.TAG_NAME, "tr")
-            for row in rows:
-                temp_table_name, temp_col_num = self.find_table_name_and_columns(row)
-                temp_col_names, temp_dup_from_header = self.find_col_names(row)
-                row_data, temp_dup_from_cells = self.find_cell_data(row, col_num, duplicate_rows)
-
-                if temp_table_name:
-                    table_name = temp_table_name
-                if temp_col_num:
-                    col_num = temp_col_num
-                if temp_dup_from_header:
-                    duplicate_rows = temp_dup_from_header
-                if temp_col_names:
-                    col_names = temp_col_names
-                if temp_dup_from_cells is not None:
-                    duplicate_rows = temp_dup_from_cells
-
-                if row_data and col_names and len(row_data) == len(col_names):
-                    data_list.append(row_data)
-
-            if table_name and col_names and data_list:
-                list_of_dicts = [dict(zip(col_names, row)) for row in data_list]
-                if table_name[0] == "Player":
-                    player_stats_dict[table_name[-1]] = list_of_dicts
-                elif table_name[0] == "Team":
-                    team_stats_dict[table_name[-1]] = list_of_dicts
-
-                self.logger.debug(
-                    "Captured table %s (%d rows, %d cols)",
-                    " / ".join(table_name),
-                    len(list_of_dicts),
-                    len(col_names),
-                )
-
-        return player_stats_dict, team_stats_dict
-
-    def find_table_name_and_columns(self, row) -> Tuple[Optional[List[str]], Optional[int]]:
-        """
-        Detect the table category/name from header rows and extract expected column count.
-
-        Returns:
-        - `(table_name_parts, num_cols)` where `table_name_parts` looks like
-          `["Player", "Hitting Statistics"]` or `["Team", "Standings"]`
-        - `(None, None)` when the row isn't a header row
-        """
-        table_name: List[str] = []
-        player_pattern = r"(Player|Pitcher)"
-        team_pattern = r"Team(?= Review)|Team Standings"
-
-        headers: List[str] = []
-        try:
-            headers = [h.text for h in row.find_elements(By.XPATH, ".//h2 | .//p")]
-        except Exception:
-            return None, None
-
-        if not headers:
-            return None, None
-
-        try:
-            num_cols_attr = row.find_element(By.TAG_NAME, "td").get_attribute("colspan")
-            num_cols = int(num_cols_attr) if num_cols_attr else None
-        except Exception:
-            num_cols = None
-
-        # Player/Pitcher tables are treated as "Player" category.
-        is_player = bool(headers and headers[0] and re.search(player_pattern, headers[0]))
-        if is_player:
-            table_name.append("Player")
-
-        # Team tables can show up in different header positions depending on the page.
-        header0 = headers[0] if len(headers) > 0 else ""
-        header1 = headers[1] if len(headers) > 1 else ""
-        m_team = re.search(team_pattern, header0) or re.search(team_pattern, header1)
-        if m_team:
-            table_name.extend(m_team.group().split(" "))
-
-        # Stat key is usually in the second header line (but we normalize it).
-        if len(headers) > 1:
-            m_key = STAT_TABLE_KEY_RE.search(headers[1])
-            if m_key:
-                table_name.append(m_key.group(1))
-
-        if not table_name:
-            return None, None
-
-        return table_name, num_cols
-
-    def find_col_names(self, row) -> Tuple[Optional[List[str]], Optional[Dict[int, List[Any]]]]:
-        """
-        Extract column names from a "banner" row and detect header rowspans.
-        """
-        try:
-            elements = row.find_elements(By.XPATH, ".//td[contains(@class, 'banner')]")
-        except Exception:
-            return None, None
-
-        if not elements:
-            return None, None
-
-        col_names: List[str] = []
-        duplicate_row_val: Dict[int, List[Any]] = {}
-        regions = {"East", "Central", "West"}
-
-        for idx, el in enumerate(elements):
-            num_rows = el.get_attribute("rowspan")
-            if num_rows:
-                duplicate_row_val[idx] = [el.text, int(num_rows)]
-
-            if el.text in regions:
-                col_names.append("Region")
-            else:
-                col_names.append(el.text.replace(" [Click for roster]", "").strip())
-
-        return col_names, duplicate_row_val
+            with ThreadPoolExecutor(max_workers=self.workers) as fetch_pool:
+                for idx, link in enumerate(links_list, start=1):
+                    fetch_pool.submit(fetch_into_queue, idx, link)
+
+                for _ in range(total):
+                    idx, raw_html = pages.get()
+                    if raw_html is None:
+                        continue
+                    link = links_list[idx - 1]
+                    try:
+                        if parse_pool is None:
+                            parsed[idx] = self.parse(raw_html, year=link.year, league=link.league)
+                        else:
+                            parsed[idx] = parse_pool.submit(parse_page, raw_html, year=link.year, league=link.league)
+                    except Exception:
+                        # e.g. an empty body (lxml: "no element found") or a broken parse pool.
+                        self.logger.warning("(%d/%d) Failed to parse: %s", idx, total, link.href)
+
+            for idx in sorted(parsed):
+                page = parsed[idx]
+                if isinstance(page, Future):
+                    try:
+                        page = page.result()
+                    except Exception:
+                        self.logger.warning("(%d/%d) Failed to parse: %s", idx, total, links_list[idx - 1].href)
+                        continue
+                self._store_page(idx, total, links_list[idx - 1].href, page)
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown()
+
+    def _store_page(self, idx: int, total: int, link: str, page: ParsedPage) -> None:
+        """Append one parsed yearly page to the output tables and record its events."""
+        year, league, player, team, events = page
+        if not year or not league:
+            self.logger.warning("(%d/%d) Skipping page (could not parse year/league): %s", idx, total, link)
+            return
 
-    def find_cell_data(
-        self,
-        row,
-        num_cols: Optional[int],
-        duplicate_rows: Dict[int, List[Any]],
-    ) -> Tuple[Optional[List[str]], Dict[int, List[Any]]]:
-        """
-        Extract cell text for a data row, handling rowspans by re-inserting duplicated values.
-        """
-        try:
-            cells = row.find_elements(
-                By.XPATH,
-                ".//td[contains(@class, 'datacolBox') or contains(@class, 'datacolBlue')]",
+        if (year, league) in self._stored_pages:
+            self.logger.warning(
+                "(%d/%d) Skipping duplicate page for year=%s league=%s: %s",
+                idx,
+                total,
+                year,
+                league,
+                link,
             )
-        except Exception:
-            return None, duplicate_rows
-
-        if not cells:
-            return None, duplicate_rows
-
-        data: List[str] = []
-        for idx, cell in enumerate(cells):
-            num_rows = cell.get_attribute("rowspan")
-            if num_rows:
-                duplicate_rows[idx] = [cell.text, int(num_rows)]
-            data.append(cell.text.strip())
-
-        if num_cols is not None and len(data) != num_cols:
-            for idx, value in list(duplicate_rows.items()):
-                data.insert(idx, value[0])
-                duplicate_rows[idx][1] -= 1
-
-        duplicate_rows = {k: v for k, v in duplicate_rows.items() if v[1] > 0}
-        return data, duplicate_rows
-
-    def clean_events(self) -> Dict[str, List[str]]:
-        """
-        Extract the small "Events" / "Salary" text block from the current yearly page.
-        """
-        events_dict: Dict[str, List[str]] = {}
-        try:
-            row = self.driver.find_element(By.XPATH, ".//td[contains(., 'Events') or contains(., 'Salary')]")
-        except Exception:
-            return events_dict
-
-        event_text = (row.text or "").split("\n")
-        for line in event_text:
-            if ": " not in line:
-                continue
-
-            title, rhs = line.split(": ", 1)
-            if "Events" in title or "Salary" in title:
-                events_dict[title] = rhs.split(" | ")
+            return
+        self._stored_pages.add((year, league))
+
+        self.logger.info("(%d/%d) Parsed: year=%s league=%s", idx, total, year, league)
+        for name, block in player.items():
+            self.add_to_table(self.player_tables[name], block, year, league)
+        for name, block in team.items():
+            self.add_to_table(self.team_tables[name], block, year, league)
+
+        self.logger.info(
+            "(%d/%d) Extracted tables: player=%d team=%d",
+            idx,
+            total,
+            len(player.keys()),
+            len(team.keys()),
+        )
 
-        return events_dict
+        if year not in self.events:
+            self.events[year] = events
+            self.logger.info("(%d/%d) Extracted events keys: %s", idx, total, list(events.keys()))
 
     # ---------- DataFrame/output helpers ----------
-    def convert_stats_to_df(
-        self,
-        dictionary: Dict[int, Dict[str, Dict[str, List[Dict[str, str]]]]],
-    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    def tables_to_dfs(self, tables: Mapping[str, Columns]) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """
-        Flatten the nested stats dictionary into three DataFrames:
+        Build the three output DataFrames from accumulated output tables (see `player_tables`/`team_tables`):
         - hitting stats
         - pitching stats
         - standings
         """
-        hit_table: List[Dict[str, Any]] = []
-        pitch_table: List[Dict[str, Any]] = []
-        standing_table: List[Dict[str, Any]] = []
-
-        for year, leagues in dictionary.items():
-            for league, data in leagues.items():
-                for items in data.get("Hitting Statistics", []):
-                    self.add_to_table(hit_table, items, year, league)
-                for items in data.get("Pitching Statistics", []):
-                    self.add_to_table(pitch_table, items, year, league)
-                for items in data.get("Standings", []):
-                    self.add_to_table(standing_table, self.normalize_standings_row(items), year, league)
-
-        standing_df = pd.DataFrame(standing_table)
+        standing_df = self.normalize_standings_columns(pd.DataFrame(tables.get("Standings", {})))
         standing_df = self.reorder_standing_columns(standing_df)
 
-        return pd.DataFrame(hit_table), pd.DataFrame(pitch_table), standing_df
+        return (
+            pd.DataFrame(tables.get("Hitting Statistics", {})),
+            pd.DataFrame(tables.get("Pitching Statistics", {})),
+            standing_df,
+        )
 
-    def normalize_standings_row(self, items: Dict[str, Any]) -> Dict[str, Any]:
+    def normalize_standings_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Normalize known Baseball Almanac standings header variants to a canonical schema.
 
         Some years use headers like:
-          - "Team [Click for roster]" instead of "Team | Roster"
+          - "Team [Click for roster]" or "Team | Roster" instead of "Team"
           - "Wins"/"Losses" instead of "W"/"L"
 
-        We normalize to:
-          Team, Roster, W, L, WP, GB, ...
+        Works on whole columns: a variant column is renamed when the canonical one is absent,
+        otherwise it fills the canonical column's gaps (rows from years using the variant) and is dropped.
         """
-        if not items:
-            return items
-
-        out = dict(items)
-
-        # Team header variants
-        if "Team [Click for roster]" in out and "Team" not in out:
-            out["Team"] = out.pop("Team [Click for roster]")
-
-        # Older layouts sometimes use a combined "Team | Roster" header.
-        # We treat this as "Team" and add an empty "Roster" column to keep schema consistent.
-        if "Team | Roster" in out:
-            value = out.pop("Team | Roster")
-            # Only overwrite Team if it doesn't already exist.
-            out.setdefault("Team", value)
-            out.setdefault("Roster", "")
+        for variant, canonical in STANDINGS_COLUMN_ALIASES.items():
+            if variant not in df.columns:
+                continue
 
-        # W/L header variants
-        if "Wins" in out and "W" not in out:
-            out["W"] = out.pop("Wins")
-        if "Losses" in out and "L" not in out:
-            out["L"] = out.pop("Losses")
+            if canonical in df.columns:
+                df[canonical] = df[canonical].fillna(df[variant])
+                df = df.drop(columns=[variant])
+            else:
+                df = df.rename(columns={variant: canonical})
 
-        return out
+        return df
 
     def reorder_standing_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -486,7 +475,7 @@ class Scraper:
         Target order (when present):
           Team, W, L, WP, GB, T, Year, League
         Any additional columns are appended after this sequence.
-        The "Roster" column is dropped (it's empty after normalization).
+        The "Roster" column is dropped if present.
         """
         if df.empty:
             return df
@@ -502,15 +491,30 @@ class Scraper:
 
         return df[ordered_cols + remaining_cols]
 
-    def add_to_table(self, table: List[Dict[str, Any]], items: Dict[str, Any], year: int, league: str) -> None:
-        """Append a single stats row into an output table, adding Year/League context columns."""
-        if not items:
+    def add_to_table(self, table: Columns, block: Columns, year: int, league: str) -> None:
+        """
+        Append a column-oriented stats table into an output table, adding Year/League context columns.
+
+        Columns the block lacks are padded with `None`; columns first seen in the block are back-filled with `None`.
+        """
+        block_rows = len(next(iter(block.values()), []))
+        if not block_rows:
             return
 
-        stats = dict(items)
-        stats["Year"] = year
-        stats["League"] = league
-        table.append(stats)
+        num_rows = len(table["Year"]) if table else 0
+
+        for key, values in block.items():
+            column = table.get(key)
+            if column is None:
+                column = table[key] = [None] * num_rows
+            column.extend(values)
+
+        table.setdefault("Year", []).extend([year] * block_rows)
+        table.setdefault("League", []).extend([league] * block_rows)
+
+        for column in table.values():
+            if len(column) == num_rows:
+                column.extend([None] * block_rows)
 
     def convert_events_to_df(self, dictionary: Dict[int, Dict[str, List[str]]]) -> pd.DataFrame:
         """Convert the events dictionary into a DataFrame for easier export/analysis."""
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import importlib.util
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .constants import USER_AGENT
+
+# urllib3 can only decode Brotli responses when a brotli package is installed.
+_HAS_BROTLI = any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi"))
+
+
+def build_session(*, pool_size: int = 10) -> requests.Session:
+    """
+    Create and return a `requests.Session` configured for Baseball Almanac.
+
+    - **pool_size**: Keep-alive connections kept per host; match it to the number of fetch workers
+      so concurrent requests never wait on (or discard) pooled connections.
+
+    The session asks for compressed responses, sends a browser User-Agent and retries
+    transient failures with a short backoff.
+    """
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": "gzip, deflate, br" if _HAS_BROTLI else "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+    )
+    return session
@@ -1,16 +1,67 @@
 from __future__ import annotations
 
+import atexit
 import os
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
+
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .constants import CHROMEDRIVER_PATH_ENV, SELENIUM_PAGE_LOAD_TIMEOUT_SECONDS
+
+# URL patterns Chrome is told not to load (see `configure_cdp`).
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.css", "*.woff*",
+    # Third-party ads/analytics scripts; they never affect the stat tables.
+    "*doubleclick*", "*googletag*", "*googlesyndication*", "*google-analytics*",
+    "*adsystem*", "*facebook.com*", "*facebook.net*",
+]
+
+# Chrome content settings turned off for scraping (2 = block). Only the DOM text is read.
+BLOCKED_CONTENT_SETTINGS = ("images", "stylesheets", "fonts", "plugins", "popups", "geolocation", "notifications")
+
+
+_DRIVER_PATH_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _resolve_chromedriver() -> str:
+    local_path = os.environ.get(CHROMEDRIVER_PATH_ENV)
+    if local_path:
+        return local_path
+
+    # Only needed when no chromedriver is named explicitly.
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    return ChromeDriverManager().install()
+
+
+def chromedriver_path() -> str:
+    """
+    Return the chromedriver executable path, resolved once per process.
+
+    The `CHROMEDRIVER_PATH` environment variable wins when set; otherwise `webdriver_manager` picks a
+    chromedriver matching the installed Chrome (a stray one on `PATH` may not). `ChromeDriverManager().install()`
+    checks the Chrome version (and possibly the network) every time it runs, so pooled drivers and later
+    Scraper instances reuse the first answer.
+    """
+    # Pool slots are built from several fetcher threads at once; only one of them should run the install.
+    with _DRIVER_PATH_LOCK:
+        return _resolve_chromedriver()
 
 
 def build_chrome_driver(*, headless: bool, profile_dir: str) -> webdriver.Chrome:
     """
     Create and return a configured Chrome WebDriver instance.
 
-    Note: `webdriver_manager` downloads/chooses an appropriate chromedriver automatically.
+    Note: the chromedriver is found locally or downloaded by `webdriver_manager` (see `chromedriver_path`).
     """
     profile_dir = os.path.abspath(profile_dir)
     os.makedirs(profile_dir, exist_ok=True)
@@ -20,9 +71,184 @@ def build_chrome_driver(*, headless: bool, profile_dir: str) -> webdriver.Chrome
         options.add_argument("--headless")
     options.add_argument("--disable-gpu")
     options.add_argument(f"--user-data-dir={profile_dir}")
+    # Return from `driver.get` at DOMContentLoaded; the tables are static markup and don't need onload.
+    options.page_load_strategy = "eager"
 
-    return webdriver.Chrome(
-        service=ChromeService(ChromeDriverManager().install()),
+    # We only read table text, so don't spend bandwidth/decoding on images, styles, fonts, etc.
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    prefs = {f"profile.managed_default_content_settings.{name}": 2 for name in BLOCKED_CONTENT_SETTINGS}
+    prefs["profile.default_content_setting_values.notifications"] = 2
+    options.add_experimental_option("prefs", prefs)
+
+    driver = webdriver.Chrome(
+        service=ChromeService(chromedriver_path()),
         options=options,
     )
 
+    try:
+        configure_cdp(driver)
+        driver.set_page_load_timeout(SELENIUM_PAGE_LOAD_TIMEOUT_SECONDS)
+    except Exception:
+        # Don't leave a Chrome/chromedriver pair running behind a driver nobody will get to use.
+        driver.quit()
+        raise
+    return driver
+
+
+def configure_cdp(driver: webdriver.Chrome) -> None:
+    """
+    Apply DevTools-level request blocking to a freshly started driver (once, before any navigation).
+
+    Blocks `BLOCKED_RESOURCE_PATTERNS` (heavy subresources the prefs don't cover, plus ad/analytics
+    trackers) and denies file downloads.
+    """
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_PATTERNS})
+    driver.execute_cdp_cmd("Browser.setDownloadBehavior", {"behavior": "deny"})
+
+
+def load_page(driver: webdriver.Chrome, url: str) -> None:
+    """
+    Navigate `driver` to `url`.
+
+    A page-load timeout stops the load instead of raising: whatever DOM arrived is kept, and callers
+    check for the content they need (see `wait_for_selector`).
+    """
+    try:
+        driver.get(url)
+    except TimeoutException:
+        driver.execute_script("window.stop();")
+
+
+def wait_for_selector(driver: webdriver.Chrome, css_selector: str, *, timeout: float) -> bool:
+    """
+    Block until an element matching `css_selector` is present on the current page.
+
+    Returns False if it doesn't show up within `timeout` seconds.
+    """
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, css_selector)))
+    except TimeoutException:
+        return False
+    return True
+
+
+# Process-wide pools of warm Chrome drivers, one per Chrome profile directory. Drivers are created
+# lazily (up to the size requested by callers) and handed back after each use instead of being quit,
+# so later page loads and later Scraper instances skip the browser cold start.
+class _DriverPool:
+    def __init__(self, *, headless: bool):
+        self.headless = headless
+        # Guards everything below; waiters are notified whenever a driver comes back or a slot frees up.
+        self.cond = threading.Condition()
+        self.idle: List[webdriver.Chrome] = []
+        # Profile slot of every live driver (or driver being built). Slot N > 0 uses "<profile_dir>-N".
+        self.slots: Dict[int, Optional[webdriver.Chrome]] = {}
+
+
+_CHROME_POOLS: Dict[str, _DriverPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(*, headless: bool, profile_dir: str) -> _DriverPool:
+    # Keyed by profile only: Chrome locks its user-data directory, so two pools can't share one.
+    with _POOLS_LOCK:
+        pool = _CHROME_POOLS.get(profile_dir)
+        if pool is None:
+            pool = _CHROME_POOLS[profile_dir] = _DriverPool(headless=headless)
+
+    if pool.headless != headless:
+        raise ValueError(
+            f"Chrome profile {profile_dir!r} is already in use by a driver pool with headless={pool.headless}; "
+            "use a different profile_dir for a different headless setting"
+        )
+    return pool
+
+
+def _release_slot(pool: _DriverPool, slot: int) -> None:
+    with pool.cond:
+        del pool.slots[slot]
+        pool.cond.notify()
+
+
+def _checkout_driver(pool: _DriverPool, *, profile_dir: str, max_drivers: int) -> webdriver.Chrome:
+    with pool.cond:
+        while True:
+            if pool.idle:
+                return pool.idle.pop()
+            if len(pool.slots) < max_drivers:
+                # Reuse the lowest free slot, so a replacement driver gets the profile its predecessor released.
+                slot = next(n for n in range(max_drivers) if n not in pool.slots)
+                pool.slots[slot] = None
+                break
+            # Pool is full: wait for another caller to hand a driver back or discard one.
+            pool.cond.wait()
+
+    # Chrome locks its user-data directory, so every extra driver gets its own profile.
+    slot_profile_dir = profile_dir if slot == 0 else f"{profile_dir}-{slot}"
+    try:
+        driver = build_chrome_driver(headless=pool.headless, profile_dir=slot_profile_dir)
+    except BaseException:
+        _release_slot(pool, slot)
+        raise
+
+    with pool.cond:
+        pool.slots[slot] = driver
+    return driver
+
+
+def _return_driver(pool: _DriverPool, driver: webdriver.Chrome) -> None:
+    with pool.cond:
+        pool.idle.append(driver)
+        pool.cond.notify()
+
+
+def _discard_driver(pool: _DriverPool, driver: webdriver.Chrome) -> None:
+    """Quit `driver` and free its pool slot, so the next checkout builds a fresh one."""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    with pool.cond:
+        slot = next(n for n, d in pool.slots.items() if d is driver)
+    _release_slot(pool, slot)
+
+
+@contextmanager
+def acquire_driver(*, headless: bool, profile_dir: str, max_drivers: int = 1) -> Iterator[webdriver.Chrome]:
+    """
+    Check out a Chrome driver from the pool for `profile_dir` and return it when done.
+
+    A new driver is only built when none is idle and fewer than `max_drivers` exist;
+    otherwise the caller blocks until one is returned or discarded. A driver whose use raised a WebDriver
+    error (dead session, crashed browser) is quit instead of going back to the pool.
+
+    Raises ValueError if `profile_dir` already has a pool with a different `headless` setting.
+    """
+    pool = _get_pool(headless=headless, profile_dir=profile_dir)
+    driver = _checkout_driver(pool, profile_dir=profile_dir, max_drivers=max(1, max_drivers))
+    try:
+        yield driver
+    except WebDriverException:
+        _discard_driver(pool, driver)
+        raise
+    except BaseException:
+        _return_driver(pool, driver)
+        raise
+    else:
+        _return_driver(pool, driver)
+
+
+def shutdown_driver_pool() -> None:
+    """Quit every idle pooled driver (registered to run at interpreter exit)."""
+    with _POOLS_LOCK:
+        pools = list(_CHROME_POOLS.values())
+
+    for pool in pools:
+        with pool.cond:
+            idle, pool.idle = pool.idle, []
+        for driver in idle:
+            _discard_driver(pool, driver)
+
+
+atexit.register(shutdown_driver_pool)
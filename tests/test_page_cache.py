@@ -0,0 +1,47 @@
+import os
+import time
+
+from diamond_data_scraper.page_cache import PageCache
+
+URL = "https://www.baseball-almanac.com/yearly/yr1970n.shtml"
+
+
+def test_missing_page_is_none(tmp_path):
+    assert PageCache(tmp_path).get(URL) is None
+
+
+def test_bytes_and_text_round_trip_as_stored(tmp_path):
+    cache = PageCache(tmp_path)
+
+    cache.put(URL, b"<html>raw</html>")
+    assert cache.get(URL) == b"<html>raw</html>"
+
+    other = URL.replace("1970", "1971")
+    cache.put(other, "<html>rendered \\u2013 page</html>")
+    assert cache.get(other) == "<html>rendered \\u2013 page</html>"
+
+
+def test_no_temporary_files_are_left_behind(tmp_path):
+    PageCache(tmp_path).put(URL, b"<html></html>")
+
+    assert [p.suffixes for p in tmp_path.iterdir()] == [[".html", ".gz"]]
+
+
+def test_expired_page_is_none(tmp_path):
+    cache = PageCache(tmp_path, max_age_days=1)
+    cache.put(URL, b"<html></html>")
+    (path,) = tmp_path.iterdir()
+
+    two_days_ago = time.time() - 2 * 24 * 60 * 60
+    os.utime(path, (two_days_ago, two_days_ago))
+
+    assert cache.get(URL) is None
+
+
+def test_corrupt_entry_is_treated_as_missing(tmp_path):
+    cache = PageCache(tmp_path)
+    cache.put(URL, b"<html></html>")
+    (path,) = tmp_path.iterdir()
+    path.write_bytes(b"not gzip")
+
+    assert cache.get(URL) is None
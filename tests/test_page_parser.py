@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+
+from diamond_data_scraper.page_parser import PageParser
+
+FIXTURE = Path(__file__).parent / "fixtures" / "yr1970n.html"
+
+
+@pytest.fixture
+def raw_html() -> bytes:
+    return FIXTURE.read_bytes()
+
+
+@pytest.fixture
+def parser() -> PageParser:
+    return PageParser()
+
+
+def test_year_league_from_header(parser, raw_html):
+    year, league, player, team, _events = parser.parse(raw_html)
+
+    assert (year, league) == (1970, "National League")
+    assert set(player) == {"Hitting Statistics"}
+    assert set(team) == {"Standings"}
+
+
+def test_year_league_from_caller_skips_header(parser, raw_html):
+    year, league, player, _team, _events = parser.parse(raw_html, year=1971, league="American League")
+
+    assert (year, league) == (1971, "American League")
+    assert player["Hitting Statistics"]["#"] == ["45", "205", "205"]
+
+
+def test_unrecognized_header_yields_empty_page(parser, raw_html):
+    page = parser.parse(raw_html.replace(b"1970 NATIONAL LEAGUE", b"1882 AMERICAN ASSOCIATION"))
+
+    assert page == (None, None, {}, {}, {})
+
+
+def test_rowspan_values_are_back_filled(parser, raw_html):
+    _year, _league, player, _team, _events = parser.parse(raw_html)
+
+    hitting = player["Hitting Statistics"]
+    assert hitting["Statistic"] == ["Home Runs", "Hits", "Hits"]
+    assert hitting["Name(s)"] == ["Johnny Bench", "Pete Rose", "Billy Williams"]
+
+
+def test_standings_columns(parser, raw_html):
+    _year, _league, _player, team, _events = parser.parse(raw_html)
+
+    standings = team["Standings"]
+    assert list(standings) == ["Team", "Wins", "Losses", "WP"]
+    assert standings["Team"] == ["Pittsburgh", "Chicago"]
+
+
+def test_events_cell_inside_layout_cell(parser, raw_html):
+    _year, _league, _player, _team, events = parser.parse(raw_html)
+
+    assert events == {
+        "Notable Events": ["All-Star Game", "World Series"],
+        "Salary": ["Average $29,303", "Minimum $12,000"],
+    }
+
+
+def test_text_source_matches_bytes(parser, raw_html):
+    # Selenium hands over `page_source` as str; it must parse the same as the HTTP bytes.
+    assert parser.parse(raw_html.decode("utf-8")) == parser.parse(raw_html)
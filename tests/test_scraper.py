@@ -0,0 +1,160 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from diamond_data_scraper.scraper import Scraper, YearLink, _parse_yearly_href, _to_arrow_tables, _write_csv
+
+FIXTURE = Path(__file__).parent / "fixtures" / "yr1970n.html"
+
+GOOD_LINK = YearLink("https://www.baseball-almanac.com/yearly/yr1970n.shtml", 1970, "National League")
+EMPTY_LINK = YearLink("https://www.baseball-almanac.com/yearly/yr1971n.shtml", 1971, "National League")
+
+
+@pytest.fixture
+def scraper():
+    scraper = Scraper()
+    yield scraper
+    scraper.close()
+
+
+@pytest.mark.parametrize("parse_workers", [0, 1])
+def test_unparseable_page_is_skipped(scraper, monkeypatch, parse_workers):
+    pages = {GOOD_LINK.href: FIXTURE.read_bytes(), EMPTY_LINK.href: b""}
+    monkeypatch.setattr(scraper, "_download", lambda url, *, ready_selector: pages[url])
+    monkeypatch.setattr("diamond_data_scraper.scraper.sleep", lambda seconds: None)
+    scraper.parse_workers = parse_workers
+
+    scraper.log_data([EMPTY_LINK, GOOD_LINK])
+
+    assert scraper._stored_pages == {(1970, "National League")}
+    assert scraper.player_tables["Hitting Statistics"]["Year"] == [1970, 1970, 1970]
+
+
+def test_csv_writers_share_one_dialect(tmp_path):
+    df = pd.DataFrame({"Team": ["Pittsburgh", "Chicago"], "W": ["89", "84"], "Year": [1970, 1970]})
+    arrow_path, pandas_path = tmp_path / "arrow.csv", tmp_path / "pandas.csv"
+
+    (table,) = _to_arrow_tables([df])
+    _write_csv(df, table, arrow_path)
+    _write_csv(df, None, pandas_path)
+
+    assert arrow_path.read_text() == pandas_path.read_text() == (
+        '"Team","W","Year"\n"Pittsburgh","89",1970\n"Chicago","84",1970\n'
+    )
+
+
+def test_year_links_from_menu_without_tbody(scraper, monkeypatch):
+    # lxml doesn't insert the implicit <tbody> a browser does, so the menu selector must not require one.
+    menu = (Path(__file__).parent / "fixtures" / "yearmenu.html").read_bytes()
+    monkeypatch.setattr(scraper, "_download", lambda url, *, ready_selector: menu)
+    monkeypatch.setattr("diamond_data_scraper.scraper.sleep", lambda seconds: None)
+
+    links = scraper.get_year_links("https://www.baseball-almanac.com/yearmenu.shtml")
+
+    assert links == [
+        YearLink("https://www.baseball-almanac.com/yearly/yr1970n.shtml", 1970, "National League"),
+        YearLink("https://www.baseball-almanac.com/yearly/yr1970a.shtml", 1970, "American League"),
+        YearLink("https://www.baseball-almanac.com/yearly/yr1971n.shtml", 1971, "National League"),
+    ]
+
+
+def test_add_to_table_pads_and_back_fills_across_schema_drift(scraper):
+    table = {}
+    scraper.add_to_table(table, {"Team": ["Pittsburgh", "Chicago"], "T": ["0", "1"]}, 1970, "National League")
+    scraper.add_to_table(table, {"Team": ["Baltimore"], "GB": ["--"]}, 1970, "American League")
+    scraper.add_to_table(table, {}, 1971, "National League")
+
+    assert table == {
+        "Team": ["Pittsburgh", "Chicago", "Baltimore"],
+        "T": ["0", "1", None],
+        "Year": [1970, 1970, 1970],
+        "League": ["National League", "National League", "American League"],
+        "GB": [None, None, "--"],
+    }
+
+
+def test_store_page_keeps_the_first_copy_of_a_year_and_league(scraper):
+    first = (1970, "National League", {"Hitting Statistics": {"Name(s)": ["Johnny Bench"]}}, {}, {})
+    repeat = (1970, "National League", {"Hitting Statistics": {"Name(s)": ["Pete Rose"]}}, {}, {})
+    other = (1970, "American League", {"Hitting Statistics": {"Name(s)": ["Frank Howard"]}}, {}, {})
+
+    for idx, page in enumerate([first, repeat, other], start=1):
+        scraper._store_page(idx, 3, f"link{idx}", page)
+
+    assert scraper.player_tables["Hitting Statistics"] == {
+        "Name(s)": ["Johnny Bench", "Frank Howard"],
+        "Year": [1970, 1970],
+        "League": ["National League", "American League"],
+    }
+
+
+def test_store_page_skips_pages_without_year_or_league(scraper):
+    scraper._store_page(1, 1, "link", (None, None, {}, {}, {}))
+
+    assert not scraper._stored_pages
+    assert not scraper.player_tables and not scraper.team_tables
+
+
+def test_tables_to_dfs(scraper):
+    tables = {
+        "Hitting Statistics": {"Statistic": ["Home Runs"], "Year": [1970], "League": ["National League"]},
+        "Standings": {
+            "Roster": ["x"],
+            "WP": [".549"],
+            "Team": ["Pittsburgh"],
+            "W": ["89"],
+            "Year": [1970],
+            "League": ["National League"],
+        },
+    }
+
+    hit_df, pitch_df, standing_df = scraper.tables_to_dfs(tables)
+
+    assert hit_df.to_dict("list") == tables["Hitting Statistics"]
+    assert pitch_df.empty
+    assert list(standing_df.columns) == ["Team", "W", "WP", "Year", "League"]
+
+
+def test_standings_header_variants_merge_across_years(scraper):
+    table = {}
+    scraper.add_to_table(table, {"Team": ["Pittsburgh"], "W": ["89"], "L": ["73"]}, 1970, "National League")
+    scraper.add_to_table(
+        table,
+        {"Team | Roster": ["Boston"], "Wins": ["91"], "Losses": ["71"]},
+        1915,
+        "American League",
+    )
+
+    df = scraper.normalize_standings_columns(pd.DataFrame(table))
+
+    assert sorted(df.columns) == ["L", "League", "Team", "W", "Year"]
+    assert df["Team"].tolist() == ["Pittsburgh", "Boston"]
+    assert df["W"].tolist() == ["89", "91"]
+    assert df["L"].tolist() == ["73", "71"]
+
+
+def test_standings_header_variant_is_renamed_when_alone(scraper):
+    df = pd.DataFrame({"Team [Click for roster]": ["Boston"], "Wins": ["91"]})
+
+    assert list(scraper.normalize_standings_columns(df).columns) == ["Team", "W"]
+
+
+@pytest.mark.parametrize(
+    "href, expected",
+    [
+        ("https://www.baseball-almanac.com/yearly/yr1970n.shtml", (1970, "n")),
+        ("https://www.baseball-almanac.com/yearly/yr1901a.shtml", (1901, "a")),
+        ("/yearly/yr1971n.shtml", (1971, "n")),
+        ("https://www.baseball-almanac.com/yearly/yr1884u.shtml", None),
+        ("https://www.baseball-almanac.com/yearly/yr1882aa.shtml", None),
+        ("https://www.baseball-almanac.com/yearly/yr19x0n.shtml", None),
+        ("https://www.baseball-almanac.com/yearly/yr11970n.shtml", None),
+        ("https://www.baseball-almanac.com/players/yr1970n.shtml", None),
+        ("https://www.baseball-almanac.com/yearly/yr1970n.shtml?x=1", None),
+        ("yr1970n.shtml", None),
+        ("", None),
+    ],
+)
+def test_parse_yearly_href(href, expected):
+    assert _parse_yearly_href(href) == expected
@@ -0,0 +1,82 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from diamond_data_scraper import webdriver_factory
+
+
+class FakeDriver:
+    def __init__(self, *, headless, profile_dir):
+        self.headless = headless
+        self.profile_dir = profile_dir
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture(autouse=True)
+def fake_chrome(monkeypatch):
+    monkeypatch.setattr(webdriver_factory, "build_chrome_driver", FakeDriver)
+    monkeypatch.setattr(webdriver_factory, "_CHROME_POOLS", {})
+
+
+def test_idle_driver_is_reused():
+    with webdriver_factory.acquire_driver(headless=True, profile_dir="profile") as first:
+        pass
+    with webdriver_factory.acquire_driver(headless=True, profile_dir="profile") as second:
+        pass
+
+    assert second is first
+
+
+def test_failed_driver_is_replaced_with_same_profile():
+    with pytest.raises(WebDriverException):
+        with webdriver_factory.acquire_driver(headless=True, profile_dir="profile") as dead:
+            raise WebDriverException("invalid session id")
+
+    with webdriver_factory.acquire_driver(headless=True, profile_dir="profile") as fresh:
+        pass
+
+    assert dead.quit_called
+    assert fresh is not dead
+    assert fresh.profile_dir == "profile"
+
+
+def test_waiter_wakes_when_the_only_driver_is_discarded():
+    checked_out = threading.Event()
+    release = threading.Event()
+    got = []
+
+    def holder():
+        with pytest.raises(WebDriverException):
+            with webdriver_factory.acquire_driver(headless=True, profile_dir="profile"):
+                checked_out.set()
+                release.wait(5)
+                raise WebDriverException("chrome crashed")
+
+    def waiter():
+        with webdriver_factory.acquire_driver(headless=True, profile_dir="profile") as driver:
+            got.append(driver)
+
+    holder_thread = threading.Thread(target=holder, daemon=True)
+    holder_thread.start()
+    checked_out.wait(5)
+    waiter_thread = threading.Thread(target=waiter, daemon=True)
+    waiter_thread.start()
+    release.set()
+    holder_thread.join(5)
+    waiter_thread.join(5)
+
+    assert not waiter_thread.is_alive()
+    assert len(got) == 1 and not got[0].quit_called
+
+
+def test_headless_mismatch_on_same_profile_is_rejected():
+    with webdriver_factory.acquire_driver(headless=True, profile_dir="profile"):
+        pass
+
+    with pytest.raises(ValueError):
+        with webdriver_factory.acquire_driver(headless=False, profile_dir="profile"):
+            pass